@@ -7,19 +7,195 @@ Features: Login system, task editing, and professional UI design.
 
 import json
 import os
+import pickle
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any
+from functools import lru_cache, partial
 import hashlib
+import hmac
+
+try:
+    import orjson  # Optional: faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
+
+# scrypt cost parameters for newly registered accounts
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+
+# Shared color palette
+COLOR_DARK = '#2c3e50'
+COLOR_SLATE = '#34495e'
+COLOR_LIGHT = '#ecf0f1'
+COLOR_WHITE = '#ffffff'
+COLOR_GREY = '#95a5a6'
+COLOR_MUTED = '#7f8c8d'
+COLOR_PRIMARY = '#3498db'
+COLOR_PRIMARY_ACTIVE = '#2980b9'
+COLOR_SUCCESS = '#27ae60'
+COLOR_WARNING = '#f39c12'
+COLOR_DANGER = '#e74c3c'
+COLOR_TEAL = '#16a085'
+
+# ttk button styles: name -> (background, active background)
+BUTTON_COLORS = {
+    'Primary': (COLOR_PRIMARY, COLOR_PRIMARY_ACTIVE),
+    'Success': (COLOR_SUCCESS, '#229954'),
+    'Warning': (COLOR_WARNING, '#d68910'),
+    'Danger': (COLOR_DANGER, '#c0392b'),
+    'Accent': ('#9b59b6', '#8e44ad'),
+    'Dark': (COLOR_SLATE, COLOR_DARK),
+    'Neutral': (COLOR_GREY, COLOR_MUTED)
+}
+
+# Rows inserted per Treeview fill step; the first step covers the visible
+# area and the rest are inserted from the event loop, bottom-up
+TREE_FILL_CHUNK = 200
+
+# Treeview label for each task status
+STATUS_ICON = {'Done': "✅ Done", 'Not Done': "⏳ Pending"}
+
+# Treeview row tag for each task status, also the wording used in status messages
+STATUS_TAG = {'Done': 'done', 'Not Done': 'pending'}
+
+# Statistics bar text, filled from (total, completed, pending, completion rate)
+STATS_TEMPLATE = ("📊 Total Tasks: {}  |  ✅ Completed: {}  |  "
+                  "⏳ Pending: {}  |  📈 Completion Rate: {:.1f}%")
+
+# Shared fonts, created once per Tk root by init_fonts()
+FONT_FAMILY = "Segoe UI"
+FONT_LOGO = FONT_TITLE = FONT_SUBTITLE = FONT_HEADER = FONT_LARGE = None
+FONT_BUTTON = FONT_ENTRY = FONT_LABEL = FONT_TREE = None
+FONT_SMALL = FONT_SMALL_BOLD = FONT_LINK = None
+
+
+def init_fonts(root):
+    """Create the shared font objects for root."""
+    global FONT_LOGO, FONT_TITLE, FONT_SUBTITLE, FONT_HEADER, FONT_LARGE
+    global FONT_BUTTON, FONT_ENTRY, FONT_LABEL, FONT_TREE
+    global FONT_SMALL, FONT_SMALL_BOLD, FONT_LINK
+    FONT_LOGO = tkfont.Font(root, family=FONT_FAMILY, size=28, weight='bold')
+    FONT_TITLE = tkfont.Font(root, family=FONT_FAMILY, size=24, weight='bold')
+    FONT_SUBTITLE = tkfont.Font(root, family=FONT_FAMILY, size=16, weight='bold')
+    FONT_HEADER = tkfont.Font(root, family=FONT_FAMILY, size=12, weight='bold')
+    FONT_LARGE = tkfont.Font(root, family=FONT_FAMILY, size=12)
+    FONT_BUTTON = tkfont.Font(root, family=FONT_FAMILY, size=11, weight='bold')
+    FONT_ENTRY = tkfont.Font(root, family=FONT_FAMILY, size=11)
+    FONT_LABEL = tkfont.Font(root, family=FONT_FAMILY, size=10, weight='bold')
+    FONT_TREE = tkfont.Font(root, family=FONT_FAMILY, size=10)
+    FONT_SMALL = tkfont.Font(root, family=FONT_FAMILY, size=9)
+    FONT_SMALL_BOLD = tkfont.Font(root, family=FONT_FAMILY, size=9, weight='bold')
+    FONT_LINK = tkfont.Font(root, family=FONT_FAMILY, size=9, weight='bold', underline=True)
+
+
+def init_styles(root):
+    """Configure the shared ttk button and entry styles for root."""
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    # Cursor isn't a style option; set it for every ttk button through the option database
+    root.option_add('*TButton.cursor', 'hand2')
+    
+    # '<Color>.TButton' sets the colors; '<Size>.<Color>.TButton' inherits them
+    # and only overrides font and padding.
+    sizes = {
+        'Large': (FONT_BUTTON, (25, 10)),
+        'Wide': (FONT_LABEL, (25, 8)),
+        'Small': (FONT_SMALL_BOLD, (15, 5))
+    }
+    for name, (color, active) in BUTTON_COLORS.items():
+        style_name = f'{name}.TButton'
+        style.configure(style_name, font=FONT_LABEL, padding=(15, 8), relief='flat',
+                        background=color, foreground='white', focuscolor=color,
+                        bordercolor=color, lightcolor=color, darkcolor=color)
+        style.map(style_name,
+                  background=[('active', active)],
+                  lightcolor=[('active', active)],
+                  darkcolor=[('active', active)])
+        for size, (font, padding) in sizes.items():
+            style.configure(f'{size}.{style_name}', font=font, padding=padding)
+    
+    for style_name, fieldbg in (('App.TEntry', COLOR_LIGHT), ('Dialog.TEntry', 'white')):
+        style.configure(style_name, padding=5, fieldbackground=fieldbg,
+                        foreground=COLOR_DARK, insertcolor=COLOR_DARK,
+                        bordercolor=fieldbg, lightcolor=fieldbg, darkcolor=fieldbg)
+
+
+def status_icon(status):
+    """Return the Treeview label for status, treating unknown statuses as pending."""
+    return STATUS_ICON.get(status, STATUS_ICON['Not Done'])
+
+
+@dataclass(slots=True)
+class Task:
+    """A single to-do item."""
+    id: int
+    name: str
+    status: str
+    created_at: str
+    display_status: str = field(default='', compare=False)  # Treeview label, not persisted
+    
+    def __post_init__(self):
+        self.display_status = status_icon(self.status)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a task from its saved dict form."""
+        return cls(data['id'], data['name'], data['status'], data['created_at'])
+    
+    def to_dict(self):
+        """Return the dict form saved to disk."""
+        return {'id': self.id, 'name': self.name, 'status': self.status, 'created_at': self.created_at}
+
+
+def dumps_json(data, indent=False):
+    """Serialize data to newline-terminated UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def loads_json(raw):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_atomic(path, data, indent=False):
+    """Write data as JSON to a temp file, then atomically replace path."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(dumps_json(data, indent))
+        # Make sure the data is on disk before the rename, or a crash could
+        # leave an empty file in place of the old one
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 class LoginWindow:
-    def __init__(self, root):
+    def __init__(self, root, on_login=None):
         self.root = root
+        self.on_login = on_login  # Called with the username after a successful login
+        # The root may still be sized and maximized for the task list after a logout
+        self.root.state('normal')
+        self.root.minsize(1, 1)
         self.root.title("To-Do List - Login")
         self.root.geometry("450x550")
-        self.root.configure(bg='#ecf0f1')
+        self.root.configure(bg=COLOR_LIGHT)
         self.root.resizable(False, False)
         
         self.users_file = "users.json"
@@ -43,108 +219,156 @@ class LoginWindow:
         self.users = {}
         if os.path.exists(self.users_file):
             try:
-                with open(self.users_file, 'r', encoding='utf-8') as f:
-                    self.users = json.load(f)
+                with open(self.users_file, 'rb') as f:
+                    self.users = loads_json(f.read())
             except:
                 self.users = {}
     
     def save_users(self):
         """Save user credentials."""
         try:
-            with open(self.users_file, 'w', encoding='utf-8') as f:
-                json.dump(self.users, f, indent=2, ensure_ascii=False)
+            write_json_atomic(self.users_file, self.users, indent=True)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save: {e}")
     
-    def hash_password(self, password):
-        """Hash password."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def hash_password(password):
+        """Legacy unsalted SHA-256 hash (cached; cleared on logout)."""
         return hashlib.sha256(password.encode()).hexdigest()
     
-    def clear_ui(self):
-        """Clear all widgets."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def derive_key(password, salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+        """Derive scrypt key for password (cached per session; cleared on logout)."""
+        return hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt),
+                              n=n, r=r, p=p, dklen=SCRYPT_DKLEN).hex()
+    
+    def make_credentials(self, password):
+        """Build a salted scrypt credential record for password."""
+        salt = os.urandom(16).hex()
+        return {
+            'salt': salt,
+            'key': self.derive_key(password, salt),
+            'n': SCRYPT_N,
+            'r': SCRYPT_R,
+            'p': SCRYPT_P
+        }
+    
+    def verify_password(self, user, password):
+        """Check password against a stored user record (scrypt or legacy SHA-256)."""
+        if 'key' in user:
+            key = self.derive_key(password, user['salt'], user.get('n', SCRYPT_N),
+                                  user.get('r', SCRYPT_R), user.get('p', SCRYPT_P))
+            return hmac.compare_digest(key, user['key'])
+        return hmac.compare_digest(self.hash_password(password), user.get('password', ''))
     
     def create_ui(self):
-        """Create the user interface (login or signup)."""
-        self.clear_ui()
+        """Create the user interface once; apply_mode() switches login/signup."""
+        # Everything lives in one frame so a login unmounts just this form
+        self.frame = tk.Frame(self.root, bg=COLOR_LIGHT)
+        self.frame.pack(fill='both', expand=True)
         
         # Header
-        header_color = '#27ae60' if self.is_signup else '#2c3e50'
-        header_text = "Create Account" if self.is_signup else "Welcome Back"
+        self.header = tk.Frame(self.frame, height=100)
+        self.header.pack(fill='x')
+        self.header.pack_propagate(False)
         
-        header = tk.Frame(self.root, bg=header_color, height=100)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        tk.Label(header, text="📝 To-Do List", font=("Segoe UI", 28, "bold"), 
-                bg=header_color, fg='white').pack(pady=(15, 5))
-        tk.Label(header, text=header_text, font=("Segoe UI", 12), 
-                bg=header_color, fg='#ecf0f1').pack()
+        self.logo_label = tk.Label(self.header, text="📝 To-Do List", font=FONT_LOGO, 
+                                   fg='white')
+        self.logo_label.pack(pady=(15, 5))
+        self.subtitle_label = tk.Label(self.header, font=FONT_LARGE, fg=COLOR_LIGHT)
+        self.subtitle_label.pack()
         
         # Form
-        form = tk.Frame(self.root, bg='white')
+        form = tk.Frame(self.frame, bg='white')
         form.pack(fill='both', expand=True, padx=40, pady=25)
         
-        title_text = "Create Your Account" if self.is_signup else "Sign In"
-        tk.Label(form, text=title_text, font=("Segoe UI", 16, "bold"), 
-                bg='white', fg='#2c3e50').pack(pady=(0, 25))
+        self.title_label = tk.Label(form, font=FONT_SUBTITLE, bg='white', fg=COLOR_DARK)
+        self.title_label.pack(pady=(0, 25))
         
         # Username
-        tk.Label(form, text="Username" + (" (min 3)" if self.is_signup else ""), 
-                font=("Segoe UI", 10, "bold"), bg='white', fg='#34495e', anchor='w').pack(fill='x', pady=(0, 5))
-        self.username_entry = tk.Entry(form, font=("Segoe UI", 11), bg='#ecf0f1', 
-                                       fg='#2c3e50', relief='flat', bd=5, insertbackground='#2c3e50')
+        self.username_label = tk.Label(form, font=FONT_LABEL, bg='white', 
+                                       fg=COLOR_SLATE, anchor='w')
+        self.username_label.pack(fill='x', pady=(0, 5))
+        self.username_entry = ttk.Entry(form, font=FONT_ENTRY, style='App.TEntry')
         self.username_entry.pack(fill='x', ipady=10, pady=(0, 15))
         self.username_entry.bind('<Return>', lambda e: self.password_entry.focus_set())
         
         # Password
-        tk.Label(form, text="Password" + (" (min 4)" if self.is_signup else ""), 
-                font=("Segoe UI", 10, "bold"), bg='white', fg='#34495e', anchor='w').pack(fill='x', pady=(0, 5))
-        self.password_entry = tk.Entry(form, font=("Segoe UI", 11), bg='#ecf0f1', 
-                                       fg='#2c3e50', show='•', relief='flat', bd=5, insertbackground='#2c3e50')
+        self.password_label = tk.Label(form, font=FONT_LABEL, bg='white', 
+                                       fg=COLOR_SLATE, anchor='w')
+        self.password_label.pack(fill='x', pady=(0, 5))
+        self.password_entry = ttk.Entry(form, font=FONT_ENTRY, style='App.TEntry', show='•')
         self.password_entry.pack(fill='x', ipady=10, pady=(0, 15))
+        self.password_entry.bind('<Return>', self.on_password_return)
         
-        # Confirm password (only for signup)
-        self.confirm_password_entry = None
-        if self.is_signup:
-            tk.Label(form, text="Confirm Password", font=("Segoe UI", 10, "bold"), 
-                    bg='white', fg='#34495e', anchor='w').pack(fill='x', pady=(0, 5))
-            self.confirm_password_entry = tk.Entry(form, font=("Segoe UI", 11), bg='#ecf0f1', 
-                                                   fg='#2c3e50', show='•', relief='flat', bd=5, insertbackground='#2c3e50')
-            self.confirm_password_entry.pack(fill='x', ipady=10, pady=(0, 20))
-            self.confirm_password_entry.bind('<Return>', lambda e: self.register())
-            self.password_entry.bind('<Return>', lambda e: self.confirm_password_entry.focus_set())
-        else:
-            self.password_entry.bind('<Return>', lambda e: self.login())
+        # Confirm password row (packed only for signup)
+        self.confirm_row = tk.Frame(form, bg='white')
+        tk.Label(self.confirm_row, text="Confirm Password", font=FONT_LABEL, 
+                bg='white', fg=COLOR_SLATE, anchor='w').pack(fill='x', pady=(0, 5))
+        self.confirm_password_entry = ttk.Entry(self.confirm_row, font=FONT_ENTRY,
+                                                style='App.TEntry', show='•')
+        self.confirm_password_entry.pack(fill='x', ipady=10, pady=(0, 20))
+        self.confirm_password_entry.bind('<Return>', self.register)
         
         # Button
-        btn_text = "Sign Up" if self.is_signup else "Sign In"
-        btn_color = '#27ae60' if self.is_signup else '#3498db'
-        btn_cmd = self.register if self.is_signup else self.login
-        btn = tk.Button(form, text=btn_text, command=btn_cmd, font=("Segoe UI", 11, "bold"),
-                       bg=btn_color, fg='white', relief='flat', cursor='hand2', pady=10)
-        btn.pack(fill='x', pady=(0, 15))
+        self.btn = ttk.Button(form)
+        self.btn.pack(fill='x', pady=(0, 15))
         
         # Switch link
-        switch_text = "Already have an account? Sign In" if self.is_signup else "Don't have an account? Sign Up"
         switch_frame = tk.Frame(form, bg='white')
         switch_frame.pack(fill='x')
-        tk.Label(switch_frame, text=switch_text.split('?')[0] + "?", 
-                font=("Segoe UI", 9), bg='white', fg='#7f8c8d').pack(side='left')
-        link = tk.Label(switch_frame, text=switch_text.split('?')[1].strip(), 
-                       font=("Segoe UI", 9, "bold", "underline"), bg='white', fg='#3498db', cursor='hand2')
-        link.pack(side='left', padx=5)
-        link.bind('<Button-1>', lambda e: self.toggle_mode())
+        self.switch_label = tk.Label(switch_frame, font=FONT_SMALL, bg='white', fg=COLOR_MUTED)
+        self.switch_label.pack(side='left')
+        self.switch_link = tk.Label(switch_frame, font=FONT_LINK, 
+                                    bg='white', fg=COLOR_PRIMARY, cursor='hand2')
+        self.switch_link.pack(side='left', padx=5)
+        self.switch_link.bind('<Button-1>', self.toggle_mode)
+        
+        self.apply_mode()
+    
+    def apply_mode(self):
+        """Reconfigure the existing widgets for login or signup mode."""
+        header_color = COLOR_SUCCESS if self.is_signup else COLOR_DARK
+        self.header.configure(bg=header_color)
+        self.logo_label.configure(bg=header_color)
+        self.subtitle_label.configure(bg=header_color,
+                                      text="Create Account" if self.is_signup else "Welcome Back")
+        self.title_label.configure(text="Create Your Account" if self.is_signup else "Sign In")
+        self.username_label.configure(text="Username" + (" (min 3)" if self.is_signup else ""))
+        self.password_label.configure(text="Password" + (" (min 4)" if self.is_signup else ""))
         
+        if self.is_signup:
+            self.confirm_row.pack(fill='x', before=self.btn)
+            self.btn.configure(text="Sign Up", style='Large.Success.TButton', command=self.register)
+            switch_text = "Already have an account? Sign In"
+        else:
+            self.confirm_row.pack_forget()
+            self.btn.configure(text="Sign In", style='Large.Primary.TButton', command=self.login)
+            switch_text = "Don't have an account? Sign Up"
+        
+        prompt, action = switch_text.split('?')
+        self.switch_label.configure(text=prompt + "?")
+        self.switch_link.configure(text=action.strip())
+        
+        for entry in (self.username_entry, self.password_entry, self.confirm_password_entry):
+            entry.delete(0, tk.END)
         self.username_entry.focus_set()
     
-    def toggle_mode(self):
+    def on_password_return(self, event=None):
+        """Move on to the confirm field when signing up, otherwise log in."""
+        if self.is_signup:
+            self.confirm_password_entry.focus_set()
+        else:
+            self.login()
+    
+    def toggle_mode(self, event=None):
         """Switch between login and signup."""
         self.is_signup = not self.is_signup
-        self.create_ui()
+        self.apply_mode()
     
-    def login(self):
+    def login(self, event=None):
         """Handle login."""
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
@@ -156,22 +380,31 @@ class LoginWindow:
         if username not in self.users:
             if messagebox.askyesno("Not Found", f"Username '{username}' not found.\nCreate new account?"):
                 self.is_signup = True
-                self.create_ui()
+                self.apply_mode()
                 self.username_entry.insert(0, username)
             return
         
-        if self.users[username]['password'] != self.hash_password(password):
+        user = self.users[username]
+        if not self.verify_password(user, password):
             messagebox.showerror("Error", "Incorrect password!")
             self.password_entry.delete(0, tk.END)
             return
         
+        # Upgrade legacy SHA-256 accounts to scrypt on successful login
+        if 'key' not in user:
+            user.pop('password', None)
+            user.update(self.make_credentials(password))
+            self.save_users()
+        
         self.current_user = username
         messagebox.showinfo("Success", f"Welcome, {username}!")
-        self.root.quit()
+        self.frame.destroy()
+        if self.on_login:
+            self.on_login(username)
     
-    def register(self):
+    def register(self, event=None):
         """Handle registration."""
-        if not self.is_signup or not self.confirm_password_entry:
+        if not self.is_signup:
             messagebox.showerror("Error", "Please use the Sign Up page!")
             return
         
@@ -213,15 +446,15 @@ class LoginWindow:
         
         # Create account
         self.users[username] = {
-            'password': self.hash_password(password),
-            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            **self.make_credentials(password),
+            'created_at': datetime.now().isoformat(sep=" ", timespec="seconds")
         }
         self.save_users()
         messagebox.showinfo("Success", f"Account created!\nWelcome, {username}!")
         
         # Switch to login
         self.is_signup = False
-        self.create_ui()
+        self.apply_mode()
         self.username_entry.insert(0, username)
         self.password_entry.focus_set()
     
@@ -237,7 +470,7 @@ class TodoGUIApp:
         self.root.title(f"📝 To-Do List Application - {username}")
         # Start with a larger default size, enforce a minimum and open maximized
         self.root.geometry("1200x800")
-        self.root.configure(bg='#ecf0f1')
+        self.root.configure(bg=COLOR_LIGHT)
         self.root.resizable(True, True)
         # Prevent window from being too small so bottom/action buttons remain visible
         self.root.minsize(1000, 700)  # Set minimum window size
@@ -249,11 +482,24 @@ class TodoGUIApp:
         
         # Data
         self.filename = f"tasks_{username}.txt"
-        self.tasks = []
         self.current_filter = None  # Track current filter state
-        
-        # Load existing tasks
-        self.load_tasks()
+        self.last_stats = None  # Statistics currently shown in stats_label
+        self.by_status = {}  # status -> {id: task}, kept in id (display) order
+        self.unsorted_buckets = set()  # statuses whose bucket needs re-sorting by id
+        self.pending_rows = []  # (iid, values, tags) rows for the fill in progress
+        self.fill_head = 0  # rows[:fill_head] are inserted first, at the top
+        self.fill_tail = 0  # rows[fill_tail:] have been inserted below them
+        self.fill_after_id = None
+        self.dirty = False  # Unsaved changes pending a debounced write
+        self.save_after_id = None
+        self.poll_after_id = None
+        self.edit_window = None  # Edit dialog, built on first use
+        self.edit_task_ref = None
+        self.root_sequences = []  # Root-level bindings to remove on logout
+        self.loaded = False  # Set once tasks from disk have been applied
+        self.load_failed = False  # Set if the task file could not be read; blocks saves
+        self.load_queue = queue.Queue()
+        self.index_tasks([])
         
         # Create GUI elements
         self.create_widgets()
@@ -261,6 +507,31 @@ class TodoGUIApp:
         
         # Center the window
         self.center_window()
+        
+        # Load existing tasks off the UI thread; poll_loaded() applies them
+        threading.Thread(target=self.bg_load, daemon=True).start()
+        self.poll_after_id = self.root.after(20, self.poll_loaded)
+        
+        # Flush pending writes when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+    
+    def bind_root(self, sequence, handler):
+        """Bind handler on the root window and remember it for teardown()."""
+        self.root.bind(sequence, handler)
+        self.root_sequences.append(sequence)
+    
+    def teardown(self):
+        """Remove this app from the shared root so the login form can reuse it."""
+        for after_id in (self.save_after_id, self.status_after_id, self.fill_after_id,
+                         self.poll_after_id):
+            if after_id:
+                self.root.after_cancel(after_id)
+        self.loaded = True  # Ignore a load still in flight
+        for sequence in self.root_sequences:
+            self.root.unbind(sequence)
+        self.root.protocol("WM_DELETE_WINDOW", self.root.destroy)
+        for widget in self.root.winfo_children():
+            widget.destroy()
     
     def center_window(self):
         """Center the window on screen."""
@@ -271,167 +542,281 @@ class TodoGUIApp:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"+{x}+{y}")
     
-    def load_tasks(self):
-        """Load tasks from file."""
-        if os.path.exists(self.filename):
+    def read_tasks(self):
+        """Read tasks from file (safe to call from a worker thread)."""
+        tasks = self.load_tasks_cache()
+        if tasks is None:
+            # Only a missing file means no tasks. A file that does not parse
+            # raises, so the load fails and saves are blocked
             try:
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    self.tasks = json.load(file)
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.tasks = []
+                with open(self.filename, 'rb') as file:
+                    tasks = loads_json(file.read())
+            except FileNotFoundError:
+                tasks = []
+        # A malformed record fails the whole load (and so blocks saves) rather
+        # than loading an empty list that the next save would write back
+        try:
+            return [Task.from_dict(data) for data in tasks]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"malformed task record ({e!r})") from e
+    
+    def bg_load(self):
+        """Worker thread: read tasks and hand them, or the error, to the UI thread."""
+        try:
+            result = self.read_tasks()
+        except Exception as e:
+            result = e
+        self.load_queue.put(result)
+    
+    def poll_loaded(self):
+        """Apply tasks from the worker thread once they are available."""
+        if self.loaded or self.load_failed:
+            return
+        try:
+            result = self.load_queue.get_nowait()
+        except queue.Empty:
+            self.poll_after_id = self.root.after(20, self.poll_loaded)
+            return
+        self.poll_after_id = None
+        if isinstance(result, Exception):
+            self.fail_load(result)
         else:
-            self.tasks = []
+            self.apply_loaded(result)
+    
+    def fail_load(self, error):
+        """Report a task file that could not be read and never save over it."""
+        self.load_failed = True
+        messagebox.showerror("Error", f"Failed to load tasks: {error}\n"
+                             "Changes made in this session will not be saved.")
+    
+    def apply_loaded(self, tasks):
+        """Install tasks read from disk, keeping any added before loading finished."""
+        added = list(self.tasks_by_id.values())
+        self.index_tasks(tasks)
+        for task in added:
+            task.id = self.next_id
+            self.next_id += 1
+            self.tasks_by_id[task.id] = task
+            self.add_to_bucket(task)
+            if task.status == 'Done':
+                self.completed_count += 1
+        self.loaded = True
+        
+        self.refresh_task_list()
+        self.update_statistics()
+        if self.dirty:
+            self.schedule_save()
+    
+    def load_tasks_cache(self):
+        """Return tasks from the pickle sidecar if it is at least as new as the JSON file."""
+        cache = self.filename + '.pkl'
+        try:
+            if os.path.getmtime(cache) < os.path.getmtime(self.filename):
+                return None
+            with open(cache, 'rb') as file:
+                return pickle.load(file)
+        except Exception:
+            return None
+    
+    def index_tasks(self, tasks):
+        """Rebuild the id -> task store, status buckets and next free id from tasks."""
+        # tasks_by_id is the only task store; dicts keep insertion (display) order
+        self.tasks_by_id = {task.id: task for task in tasks}
+        self.completed_count = sum(1 for task in tasks if task.status == 'Done')
+        self.by_status = {'Done': {}, 'Not Done': {}}
+        self.unsorted_buckets.clear()
+        for task in tasks:
+            self.by_status.setdefault(task.status, {})[task.id] = task
+        self.next_id = max(self.tasks_by_id, default=0) + 1
+    
+    def add_to_bucket(self, task):
+        """Add a task to its status bucket, flagging the bucket if it lands out of order."""
+        bucket = self.by_status.setdefault(task.status, {})
+        if bucket and task.id < next(reversed(bucket)):
+            self.unsorted_buckets.add(task.status)
+        bucket[task.id] = task
+    
+    def remove_from_bucket(self, task):
+        """Remove a task from its status bucket."""
+        self.by_status[task.status].pop(task.id, None)
+    
+    def set_task_status(self, task, status):
+        """Set a task's status, its cached display label and its status bucket."""
+        if status == task.status:
+            return
+        # Keep the running completed count in step with status changes
+        if status == 'Done':
+            self.completed_count += 1
+        elif task.status == 'Done':
+            self.completed_count -= 1
+        self.remove_from_bucket(task)
+        task.status = status
+        task.display_status = status_icon(status)
+        self.add_to_bucket(task)
     
     def save_tasks(self):
         """Save tasks to file."""
+        tasks = [task.to_dict() for task in self.tasks_by_id.values()]
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(self.tasks, file, indent=2, ensure_ascii=False)
+            write_json_atomic(self.filename, tasks)
+            # Pickle sidecar for faster loading; the JSON file stays authoritative
+            cache = self.filename + '.pkl'
+            with open(cache + '.tmp', 'wb') as file:
+                pickle.dump(tasks, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(cache + '.tmp', cache)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save tasks: {e}")
     
+    def schedule_save(self):
+        """Mark tasks dirty and coalesce writes into one save within 500 ms."""
+        self.dirty = True
+        if not self.loaded:
+            return  # apply_loaded() schedules the save once the file has been read
+        # Don't push back a pending save, so changes reach disk within 500 ms
+        # even while the user keeps editing
+        if self.save_after_id is None:
+            self.save_after_id = self.root.after(500, self.flush_save)
+    
+    def flush_save(self):
+        """Write tasks now if there are unsaved changes."""
+        if self.save_after_id:
+            self.root.after_cancel(self.save_after_id)
+            self.save_after_id = None
+        if self.dirty and not self.load_failed:
+            if not self.loaded:
+                # Never overwrite the file before its tasks have been merged in
+                try:
+                    tasks = self.read_tasks()
+                except Exception as e:
+                    self.fail_load(e)
+                    return
+                self.apply_loaded(tasks)
+            self.save_tasks()
+            self.dirty = False
+    
     def create_widgets(self):
         """Create all GUI widgets with professional styling."""
         # Header frame with title and user info
-        header_frame = tk.Frame(self.root, bg='#2c3e50', height=80)
+        header_frame = tk.Frame(self.root, bg=COLOR_DARK, height=80)
         header_frame.pack(fill='x', padx=0, pady=0)
         header_frame.pack_propagate(False)
         
         title_label = tk.Label(
             header_frame, 
             text="📝 To-Do List Manager", 
-            font=("Segoe UI", 24, "bold"),
-            bg='#2c3e50',
-            fg='#ecf0f1'
+            font=FONT_TITLE,
+            bg=COLOR_DARK,
+            fg=COLOR_LIGHT
         )
         title_label.pack(side='left', padx=30, pady=20)
         
         # User info and logout button
-        user_frame = tk.Frame(header_frame, bg='#2c3e50')
+        user_frame = tk.Frame(header_frame, bg=COLOR_DARK)
         user_frame.pack(side='right', padx=30, pady=20)
         
         user_label = tk.Label(
             user_frame,
             text=f"👤 {self.username}",
-            font=("Segoe UI", 11),
-            bg='#2c3e50',
+            font=FONT_ENTRY,
+            bg=COLOR_DARK,
             fg='#bdc3c7'
         )
         user_label.pack(side='left', padx=(0, 15))
         
-        logout_btn = tk.Button(
+        logout_btn = ttk.Button(
             user_frame,
             text="🚪 Logout",
             command=self.logout,
-            font=("Segoe UI", 9, "bold"),
-            bg='#e74c3c',
-            fg='white',
-            activebackground='#c0392b',
-            activeforeground='white',
-            relief='flat',
-            cursor='hand2',
-            padx=15,
-            pady=5
+            style='Small.Danger.TButton'
         )
         logout_btn.pack(side='left')
         
         # Main container frame
-        main_container = tk.Frame(self.root, bg='#ecf0f1')
-        main_container.pack(fill='both', expand=True, padx=20, pady=(20, 80))  # Add bottom padding
+        main_container = tk.Frame(self.root, bg=COLOR_LIGHT)
+        main_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Add task section
-        add_section = tk.Frame(main_container, bg='#ffffff', relief='flat', bd=0)
+        add_section = tk.Frame(main_container, bg=COLOR_WHITE, relief='flat', bd=0)
         add_section.pack(fill='x', pady=(0, 15))
         
         # Add task header
-        add_header = tk.Frame(add_section, bg='#3498db', height=40)
+        add_header = tk.Frame(add_section, bg=COLOR_PRIMARY, height=40)
         add_header.pack(fill='x')
         add_header.pack_propagate(False)
         
         tk.Label(
             add_header,
             text="➕ Add New Task",
-            font=("Segoe UI", 12, "bold"),
-            bg='#3498db',
+            font=FONT_HEADER,
+            bg=COLOR_PRIMARY,
             fg='white'
         ).pack(side='left', padx=15, pady=10)
         
         # Add task input area
-        add_input_area = tk.Frame(add_section, bg='#ffffff')
+        add_input_area = tk.Frame(add_section, bg=COLOR_WHITE)
         add_input_area.pack(fill='x', padx=20, pady=20)
         
-        input_container = tk.Frame(add_input_area, bg='#ffffff')
+        input_container = tk.Frame(add_input_area, bg=COLOR_WHITE)
         input_container.pack(fill='x')
         
-        self.task_entry = tk.Entry(
+        self.task_entry = ttk.Entry(
             input_container,
-            font=("Segoe UI", 11),
-            bg='#ecf0f1',
-            fg='#2c3e50',
-            relief='flat',
-            insertbackground='#2c3e50',
-            bd=5
+            font=FONT_ENTRY,
+            style='App.TEntry'
         )
         self.task_entry.pack(side='left', fill='x', expand=True, ipady=10, padx=(0, 10))
-        self.task_entry.bind('<Return>', lambda e: self.add_task())
+        self.task_entry.bind('<Return>', self.add_task)
         
-        add_button = tk.Button(
+        add_button = ttk.Button(
             input_container, 
             text="Add Task", 
             command=self.add_task,
-            bg='#3498db',
-            fg='white',
-            font=("Segoe UI", 11, "bold"),
-            activebackground='#2980b9',
-            activeforeground='white',
-            relief='flat',
-            cursor='hand2',
-            padx=25,
-            pady=10
+            style='Large.Primary.TButton'
         )
         add_button.pack(side='left')
         
         # Task list section
-        list_section = tk.Frame(main_container, bg='#ffffff', relief='flat', bd=0)
+        list_section = tk.Frame(main_container, bg=COLOR_WHITE, relief='flat', bd=0)
         list_section.pack(fill='both', expand=True, pady=(0, 15))
         
         # Task list header
-        list_header = tk.Frame(list_section, bg='#34495e', height=40)
+        list_header = tk.Frame(list_section, bg=COLOR_SLATE, height=40)
         list_header.pack(fill='x')
         list_header.pack_propagate(False)
         
         tk.Label(
             list_header,
             text="📋 Your Tasks",
-            font=("Segoe UI", 12, "bold"),
-            bg='#34495e',
+            font=FONT_HEADER,
+            bg=COLOR_SLATE,
             fg='white'
         ).pack(side='left', padx=15, pady=10)
         
         # Treeview container
-        tree_container = tk.Frame(list_section, bg='#ffffff')
+        tree_container = tk.Frame(list_section, bg=COLOR_WHITE)
         tree_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Create treeview for tasks with custom style
         style = ttk.Style()
-        style.theme_use('clam')
         style.configure('Treeview', 
-                       background='#ffffff',
-                       foreground='#2c3e50',
-                       fieldbackground='#ffffff',
-                       font=('Segoe UI', 10),
+                       background=COLOR_WHITE,
+                       foreground=COLOR_DARK,
+                       fieldbackground=COLOR_WHITE,
+                       font=FONT_TREE,
                        rowheight=35)
         style.configure('Treeview.Heading',
-                       background='#34495e',
+                       background=COLOR_SLATE,
                        foreground='white',
-                       font=('Segoe UI', 10, 'bold'),
+                       font=FONT_LABEL,
                        relief='flat')
         style.map('Treeview',
-                 background=[('selected', '#3498db')],
+                 background=[('selected', COLOR_PRIMARY)],
                  foreground=[('selected', 'white')])
         
         columns = ('ID', 'Status', 'Task', 'Created')
         self.task_tree = ttk.Treeview(tree_container, columns=columns, show='headings', height=12, selectmode='extended')
+        self.task_tree.tag_configure('done', foreground=COLOR_MUTED)
+        self.task_tree.tag_configure('pending', foreground=COLOR_DARK)
         
         # Configure columns with proper widths - all centered
         self.task_tree.heading('ID', text='ID')
@@ -452,242 +837,204 @@ class TodoGUIApp:
         scrollbar.pack(side='right', fill='y')
         
         # allow double-click to edit
-        self.task_tree.bind('<Double-1>', lambda e: self.on_tree_double_click(e))
-        
-        # Bind Delete key for quick deletion
-        self.task_tree.bind('<Delete>', lambda e: self.delete_task())
-        self.root.bind('<Delete>', lambda e: self.delete_task() if self.task_tree.focus() else None)
-        
-        # Bind keyboard shortcuts for pending
-        self.task_tree.bind('<Control-p>', lambda e: self.mark_task_pending())
-        self.root.bind('<Control-p>', lambda e: self.mark_task_pending() if self.task_tree.focus() else None)
-        
-        # Bind keyboard shortcuts for mark done
-        self.task_tree.bind('<Control-d>', lambda e: self.mark_task_done())
-        self.root.bind('<Control-d>', lambda e: self.mark_task_done() if self.task_tree.focus() else None)
+        self.task_tree.bind('<Double-1>', self.on_tree_double_click)
+        
+        # Task shortcuts are bound once on the window and routed by keysym in
+        # on_task_shortcut (Delete, Ctrl+P pending, Ctrl+D done, Ctrl+E/F2 edit)
+        self.task_shortcuts = {
+            'Delete': self.delete_task,
+            'p': self.mark_task_pending,
+            'd': self.mark_task_done,
+            'e': self.edit_task,
+            'F2': self.edit_task  # F2 is a common edit shortcut
+        }
+        for sequence in ('<Delete>', '<Control-p>', '<Control-d>', '<Control-e>', '<F2>'):
+            self.bind_root(sequence, self.on_task_shortcut)
         
         # Bind keyboard shortcuts for filters
-        self.root.bind('<Control-Shift-d>', lambda e: self.filter_done())
-        self.root.bind('<Control-Shift-p>', lambda e: self.filter_pending())
-        self.root.bind('<Control-Shift-a>', lambda e: self.show_all_tasks())
-        
-        # Bind keyboard shortcut for edit
-        self.task_tree.bind('<Control-e>', lambda e: self.edit_task())
-        self.root.bind('<Control-e>', lambda e: self.edit_task() if self.task_tree.focus() else None)
-        self.task_tree.bind('<F2>', lambda e: self.edit_task())  # F2 is a common edit shortcut
+        self.bind_root('<Control-Shift-d>', self.filter_done)
+        self.bind_root('<Control-Shift-p>', self.filter_pending)
+        self.bind_root('<Control-Shift-a>', self.show_all_tasks)
         
         # Task Actions section - Place it right below the task list
-        action_section = tk.Frame(main_container, bg='#ffffff', relief='flat', bd=0)
+        action_section = tk.Frame(main_container, bg=COLOR_WHITE, relief='flat', bd=0)
         action_section.pack(fill='x', pady=10)  # Reduced padding
         
         # Task Actions header
-        action_header = tk.Frame(action_section, bg='#95a5a6', height=40)
+        action_header = tk.Frame(action_section, bg=COLOR_GREY, height=40)
         action_header.pack(fill='x')
         action_header.pack_propagate(False)
         
         tk.Label(
             action_header,
             text="⚙️ Task Actions",
-            font=("Segoe UI", 12, "bold"),
-            bg='#95a5a6',
+            font=FONT_HEADER,
+            bg=COLOR_GREY,
             fg='white'
         ).pack(side='left', padx=15, pady=10)
         
         # Action buttons in a single row
-        button_container = tk.Frame(action_section, bg='#ffffff')
+        button_container = tk.Frame(action_section, bg=COLOR_WHITE)
         button_container.pack(fill='x', padx=20, pady=10)  # Reduced padding
         
-        # Common button style
-        btn_style = {
-            'font': ("Segoe UI", 10, "bold"),
-            'relief': 'flat',
-            'cursor': 'hand2',
-            'pady': 8,
-            'padx': 15
-        }
-        
         # All buttons in a single row
-        tk.Button(
+        ttk.Button(
             button_container,
             text="✏️ Edit",
             command=self.edit_task,
-            bg='#3498db',
-            fg='white',
-            **btn_style
+            style='Primary.TButton'
         ).pack(side='left', padx=5)
         
-        tk.Button(
+        ttk.Button(
             button_container,
             text="✅ Done",
-            command=self.mark_task_done,
-            bg='#27ae60',
-            fg='white',
-            **btn_style
+            command=partial(self.set_status, 'Done'),
+            style='Success.TButton'
         ).pack(side='left', padx=5)
         
-        tk.Button(
+        ttk.Button(
             button_container,
             text="⏳ Pending",
-            command=self.mark_task_pending,
-            bg='#f39c12',
-            fg='white',
-            **btn_style
+            command=partial(self.set_status, 'Not Done'),
+            style='Warning.TButton'
         ).pack(side='left', padx=5)
         
-        tk.Button(
+        ttk.Button(
             button_container,
             text="🗑️ Delete",
             command=self.delete_task,
-            bg='#e74c3c',
-            fg='white',
-            **btn_style
+            style='Danger.TButton'
         ).pack(side='left', padx=5)
         
         # Separator
         tk.Label(
             button_container,
             text="|",
-            bg='#ffffff',
-            fg='#95a5a6',
-            font=("Segoe UI", 12)
+            bg=COLOR_WHITE,
+            fg=COLOR_GREY,
+            font=FONT_LARGE
         ).pack(side='left', padx=15)
         
         # Filter buttons
-        tk.Button(
+        ttk.Button(
             button_container,
             text="✅ Show Done",
             command=self.filter_done,
-            bg='#9b59b6',
-            fg='white',
-            **btn_style
+            style='Accent.TButton'
         ).pack(side='left', padx=5)
         
-        tk.Button(
+        ttk.Button(
             button_container,
             text="⏳ Show Pending",
             command=self.filter_pending,
-            bg='#f39c12',
-            fg='white',
-            **btn_style
+            style='Warning.TButton'
         ).pack(side='left', padx=5)
         
-        tk.Button(
+        ttk.Button(
             button_container,
             text="👀 Show All",
             command=self.show_all_tasks,
-            bg='#34495e',
-            fg='white',
-            **btn_style
+            style='Dark.TButton'
         ).pack(side='left', padx=5)
         
         # Statistics section
-        stats_section = tk.Frame(main_container, bg='#ffffff', relief='flat', bd=0)
+        stats_section = tk.Frame(main_container, bg=COLOR_WHITE, relief='flat', bd=0)
         stats_section.pack(fill='x')
         
-        stats_header = tk.Frame(stats_section, bg='#16a085', height=40)
+        stats_header = tk.Frame(stats_section, bg=COLOR_TEAL, height=40)
         stats_header.pack(fill='x')
         stats_header.pack_propagate(False)
         
         tk.Label(
             stats_header,
             text="📊 Statistics",
-            font=("Segoe UI", 12, "bold"),
-            bg='#16a085',
+            font=FONT_HEADER,
+            bg=COLOR_TEAL,
             fg='white'
         ).pack(side='left', padx=15, pady=10)
         
-        stats_content = tk.Frame(stats_section, bg='#ffffff')
+        stats_content = tk.Frame(stats_section, bg=COLOR_WHITE)
         stats_content.pack(fill='x', padx=20, pady=15)
         
         self.stats_label = tk.Label(
             stats_content,
             text="",
-            font=("Segoe UI", 11),
-            bg='#ffffff',
-            fg='#2c3e50',
+            font=FONT_ENTRY,
+            bg=COLOR_WHITE,
+            fg=COLOR_DARK,
             anchor='w'
         )
-        self.stats_label.pack(fill='x')
-        
-        # Bottom action bar (anchored to window bottom) - duplicates main controls for easier access
-        bottom_frame = tk.Frame(self.root, bg='#2c3e50', height=60)
-        bottom_frame.pack(side='bottom', fill='x')
-        bottom_frame.pack_propagate(False)  # Prevent frame from shrinking
-        
-        # Create inner frame for buttons
-        button_frame = tk.Frame(bottom_frame, bg='#2c3e50')
-        button_frame.pack(expand=True, pady=10)
-        
-        # Common button style
-        btn_style = {
-            'font': ("Segoe UI", 9, "bold"),
-            'relief': 'flat',
-            'cursor': 'hand2',
-            'pady': 5,
-            'padx': 10
-        }
-        
-        # Left side action buttons
-        left_frame = tk.Frame(button_frame, bg='#2c3e50')
-        left_frame.pack(side='left', padx=20)
-        
-        tk.Button(left_frame, text="✏️ Edit", command=self.edit_task,
-                 bg='#3498db', fg='white', **btn_style).pack(side='left', padx=2)
-        
-        tk.Button(left_frame, text="✅ Done", command=self.mark_task_done,
-                 bg='#27ae60', fg='white', **btn_style).pack(side='left', padx=2)
-        
-        tk.Button(left_frame, text="⏳ Pending", command=self.mark_task_pending,
-                 bg='#f39c12', fg='white', **btn_style).pack(side='left', padx=2)
-        
-        tk.Button(left_frame, text="🗑️ Delete", command=self.delete_task,
-                 bg='#e74c3c', fg='white', **btn_style).pack(side='left', padx=2)
-        
-        # Separator
-        tk.Label(button_frame, text="|", bg='#2c3e50', fg='#95a5a6').pack(side='left', padx=10)
-        
-        # Right side filter buttons
-        right_frame = tk.Frame(button_frame, bg='#2c3e50')
-        right_frame.pack(side='left')
-        
-        tk.Button(right_frame, text="✅ Done", command=self.filter_done,
-                 bg='#9b59b6', fg='white', **btn_style).pack(side='left', padx=2)
-        
-        tk.Button(right_frame, text="⏳ Pending", command=self.filter_pending,
-                 bg='#f39c12', fg='white', **btn_style).pack(side='left', padx=2)
+        self.stats_label.pack(side='left', fill='x', expand=True)
         
-        tk.Button(right_frame, text="👀 All", command=self.show_all_tasks,
-                 bg='#34495e', fg='white', **btn_style).pack(side='left', padx=2)
+        # Transient feedback for completed actions (replaces success popups)
+        self.status_label = tk.Label(
+            stats_content,
+            text="",
+            font=FONT_LABEL,
+            bg=COLOR_WHITE,
+            fg=COLOR_SUCCESS,
+            anchor='e'
+        )
+        self.status_label.pack(side='right')
+        self.status_after_id = None
         
         # Update statistics
         self.update_statistics()
     
-    def add_task(self):
+    def flash_status(self, message):
+        """Show a short-lived status message next to the statistics."""
+        self.status_label.configure(text=message)
+        if self.status_after_id:
+            self.root.after_cancel(self.status_after_id)
+        self.status_after_id = self.root.after(2000, self.clear_status)
+    
+    def clear_status(self):
+        """Clear the transient status message."""
+        self.status_after_id = None
+        self.status_label.configure(text="")
+    
+    def add_task(self, event=None):
         """Add a new task."""
         task_name = self.task_entry.get().strip()
         if not task_name:
             messagebox.showwarning("Warning", "Please enter a task name!")
             return
         
-        # Generate unique ID
-        max_id = max([task['id'] for task in self.tasks], default=0)
+        task = Task(self.next_id, task_name, 'Not Done',
+                    datetime.now().isoformat(sep=" ", timespec="seconds"))
         
-        task = {
-            'id': max_id + 1,
-            'name': task_name,
-            'status': 'Not Done',
-            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        self.tasks.append(task)
-        self.save_tasks()
+        self.tasks_by_id[task.id] = task
+        self.add_to_bucket(task)
+        self.next_id += 1
+        self.schedule_save()
         self.task_entry.delete(0, tk.END)
-        # Reset filter to show all tasks when adding new task
-        self.current_filter = None
-        self.refresh_task_list(None)
+        # Reset filter to show all tasks when adding new task; only a
+        # filter change needs a full rebuild, otherwise append the one row
+        if self.current_filter is None:
+            # Keep the new row last even if a chunked fill is still running
+            self.finish_fill()
+            self.task_tree.insert('', 'end', iid=str(task.id), values=self.task_values(task),
+                                  tags=(STATUS_TAG['Not Done'],))
+        else:
+            self.current_filter = None
+            self.refresh_task_list(None)
         self.update_statistics()
-        
-        messagebox.showinfo("Success", f"Task '{task_name}' added successfully!")
+        self.flash_status(f"Task '{task_name}' added")
+    
+    def task_values(self, task):
+        """Return the Treeview column values for a task."""
+        return (task.id, task.display_status, task.name, task.created_at)
+    
+    def update_task_row(self, task):
+        """Update a task's status cell and tag in place, or drop the row if the filter now hides it."""
+        iid = str(task.id)
+        if self.current_filter is None or task.status == self.current_filter:
+            self.task_tree.set(iid, 'Status', task.display_status)
+            self.task_tree.item(iid, tags=(STATUS_TAG.get(task.status, 'pending'),))
+        else:
+            # Later fill chunks go in at fill_head, so finish before removing a row
+            self.finish_fill()
+            self.task_tree.delete(iid)
     
     def refresh_task_list(self, filter_status=None):
         """Refresh the task list display."""
@@ -698,24 +1045,68 @@ class TodoGUIApp:
         # Use current filter for display
         active_filter = self.current_filter
         
-        # Clear existing items
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-        
-        # Add tasks to treeview
-        for task in self.tasks:
-            if active_filter is None or task['status'] == active_filter:
-                status_icon = "✅ Done" if task['status'] == 'Done' else "⏳ Pending"
-                self.task_tree.insert('', 'end', values=(
-                    task['id'],
-                    status_icon,
-                    task['name'],
-                    task['created_at']
-                ))
-    
-    def edit_task(self):
-        """Edit selected task."""
-        selection = self.task_tree.selection()
+        # Stop any fill still in progress, then clear existing items in a single Tcl call
+        if self.fill_after_id:
+            self.root.after_cancel(self.fill_after_id)
+            self.fill_after_id = None
+        self.task_tree.delete(*self.task_tree.get_children())
+        
+        # Filtered views read the pre-bucketed tasks for that status
+        if active_filter is None:
+            tasks = self.tasks_by_id.values()
+        else:
+            if active_filter in self.unsorted_buckets:
+                self.by_status[active_filter] = dict(sorted(self.by_status[active_filter].items()))
+                self.unsorted_buckets.discard(active_filter)
+            tasks = self.by_status.get(active_filter, {}).values()
+        
+        # Build rows first; task ids double as Treeview iids so rows can be
+        # updated in place. Only the first chunk is inserted before returning.
+        task_values = self.task_values
+        rows = [(str(task.id), task_values(task), (STATUS_TAG.get(task.status, 'pending'),))
+                for task in tasks]
+        self.pending_rows = rows
+        self.fill_head = min(TREE_FILL_CHUNK, len(rows))
+        self.fill_tail = len(rows)
+        self.insert_rows(rows[:self.fill_head], 0)
+        if self.fill_tail > self.fill_head:
+            self.fill_after_id = self.root.after(1, self.fill_rows)
+        else:
+            self.pending_rows = []
+    
+    def insert_rows(self, rows, index):
+        """Insert rows in order starting at index.
+        
+        Rows are inserted in reverse at a fixed index: Tk walks the sibling
+        list to find 'end', so appending N rows costs O(N^2) while this is O(N).
+        """
+        insert = self.task_tree.insert
+        for iid, values, tags in reversed(rows):
+            insert('', index, iid=iid, values=values, tags=tags)
+    
+    def fill_rows(self):
+        """Insert the next chunk of remaining rows, bottom-up, and schedule the rest."""
+        start = max(self.fill_head, self.fill_tail - TREE_FILL_CHUNK)
+        self.insert_rows(self.pending_rows[start:self.fill_tail], self.fill_head)
+        self.fill_tail = start
+        if start > self.fill_head:
+            self.fill_after_id = self.root.after(1, self.fill_rows)
+        else:
+            self.fill_after_id = None
+            self.pending_rows = []
+    
+    def finish_fill(self):
+        """Insert all remaining pending rows now."""
+        if self.fill_after_id:
+            self.root.after_cancel(self.fill_after_id)
+            self.fill_after_id = None
+            self.insert_rows(self.pending_rows[self.fill_head:self.fill_tail], self.fill_head)
+            self.pending_rows = []
+    
+    def edit_task(self, event=None, selection=None):
+        """Edit selected task; selection may be passed in if already queried."""
+        if selection is None:
+            selection = self.task_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select a task to edit!")
             return
@@ -723,259 +1114,238 @@ class TodoGUIApp:
             messagebox.showwarning("Warning", "Please select only one task to edit!")
             return
         
-        item = self.task_tree.item(selection[0])
-        task_id = int(item['values'][0])
-        current_task_name = item['values'][2]
-        
-        # Find the task
-        task = None
-        for t in self.tasks:
-            if t['id'] == task_id:
-                task = t
-                break
-        
+        # Row iids are task ids, so no Treeview round-trip is needed
+        task = self.tasks_by_id.get(int(selection[0]))
         if not task:
             messagebox.showerror("Error", "Task not found!")
             return
         
-        # Create edit dialog
+        # The dialog is built on first use and reused afterwards
+        if self.edit_window is None:
+            self.create_edit_dialog()
+        self.edit_task_ref = task
+        self.edit_entry.delete(0, tk.END)
+        self.edit_entry.insert(0, task.name)
+        self.edit_entry.select_range(0, tk.END)
+        
+        # Center the edit window
+        x = (self.edit_window.winfo_screenwidth() // 2) - (500 // 2)
+        y = (self.edit_window.winfo_screenheight() // 2) - (200 // 2)
+        self.edit_window.geometry(f"500x200+{x}+{y}")
+        self.edit_window.deiconify()
+        self.edit_window.lift()
+        self.edit_window.grab_set()
+        self.edit_entry.focus_set()
+    
+    def create_edit_dialog(self):
+        """Build the (initially hidden) edit dialog."""
         edit_window = tk.Toplevel(self.root)
+        edit_window.withdraw()
         edit_window.title("Edit Task")
-        edit_window.geometry("500x200")
-        edit_window.configure(bg='#ecf0f1')
+        edit_window.configure(bg=COLOR_LIGHT)
         edit_window.resizable(False, False)
         edit_window.transient(self.root)
-        edit_window.grab_set()
-        
-        # Center the edit window
-        edit_window.update_idletasks()
-        x = (edit_window.winfo_screenwidth() // 2) - (500 // 2)
-        y = (edit_window.winfo_screenheight() // 2) - (200 // 2)
-        edit_window.geometry(f"500x200+{x}+{y}")
+        edit_window.protocol("WM_DELETE_WINDOW", self.hide_edit_dialog)
         
         # Edit form
-        form_frame = tk.Frame(edit_window, bg='#ecf0f1')
+        form_frame = tk.Frame(edit_window, bg=COLOR_LIGHT)
         form_frame.pack(fill='both', expand=True, padx=30, pady=30)
         
         tk.Label(
             form_frame,
             text="Edit Task:",
-            font=("Segoe UI", 12, "bold"),
-            bg='#ecf0f1',
-            fg='#2c3e50',
+            font=FONT_HEADER,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             anchor='w'
         ).pack(fill='x', pady=(0, 10))
         
-        task_entry = tk.Entry(
+        self.edit_entry = ttk.Entry(
             form_frame,
-            font=("Segoe UI", 11),
-            bg='white',
-            fg='#2c3e50',
-            relief='flat',
-            insertbackground='#2c3e50',
-            bd=5
+            font=FONT_ENTRY,
+            style='Dialog.TEntry'
         )
-        task_entry.pack(fill='x', ipady=10, pady=(0, 20))
-        task_entry.insert(0, current_task_name)
-        task_entry.select_range(0, tk.END)
-        task_entry.focus_set()
+        self.edit_entry.pack(fill='x', ipady=10, pady=(0, 20))
+        self.edit_entry.bind('<Return>', self.save_edit)
         
         # Buttons
-        button_frame = tk.Frame(form_frame, bg='#ecf0f1')
+        button_frame = tk.Frame(form_frame, bg=COLOR_LIGHT)
         button_frame.pack(fill='x')
         
-        def save_edit():
-            new_name = task_entry.get().strip()
-            if not new_name:
-                messagebox.showwarning("Warning", "Task name cannot be empty!")
-                return
-            
-            task['name'] = new_name
-            self.save_tasks()
-            # Refresh with current filter
-            self.refresh_task_list(self.current_filter)
-            self.update_statistics()
-            edit_window.destroy()
-            messagebox.showinfo("Success", "Task updated successfully!")
-        
-        save_btn = tk.Button(
+        save_btn = ttk.Button(
             button_frame,
             text="Save",
-            command=save_edit,
-            bg='#3498db',
-            fg='white',
-            font=("Segoe UI", 10, "bold"),
-            activebackground='#2980b9',
-            activeforeground='white',
-            relief='flat',
-            cursor='hand2',
-            padx=25,
-            pady=8
+            command=self.save_edit,
+            style='Wide.Primary.TButton'
         )
         save_btn.pack(side='right', padx=(10, 0))
         
-        cancel_btn = tk.Button(
+        cancel_btn = ttk.Button(
             button_frame,
             text="Cancel",
-            command=edit_window.destroy,
-            bg='#95a5a6',
-            fg='white',
-            font=("Segoe UI", 10, "bold"),
-            activebackground='#7f8c8d',
-            activeforeground='white',
-            relief='flat',
-            cursor='hand2',
-            padx=25,
-            pady=8
+            command=self.hide_edit_dialog,
+            style='Wide.Neutral.TButton'
         )
         cancel_btn.pack(side='right')
         
-        task_entry.bind('<Return>', lambda e: save_edit())
+        self.edit_window = edit_window
     
-    def mark_task_done(self):
-        """Mark selected task as done."""
-        selection = self.task_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select a task to mark as done!")
+    def save_edit(self, event=None):
+        """Apply the edit dialog's name to the task being edited."""
+        new_name = self.edit_entry.get().strip()
+        if not new_name:
+            messagebox.showwarning("Warning", "Task name cannot be empty!")
             return
         
-        item = self.task_tree.item(selection[0])
-        task_id = int(item['values'][0])
-        
-        for task in self.tasks:
-            if task['id'] == task_id:
-                if task['status'] == 'Done':
-                    messagebox.showinfo("Info", "Task is already marked as done!")
-                else:
-                    task['status'] = 'Done'
-                    self.save_tasks()
-                    # Refresh with current filter
-                    self.refresh_task_list(self.current_filter)
-                    self.update_statistics()
-                    messagebox.showinfo("Success", f"Task '{task['name']}' marked as done!")
-                return
-    
-    def mark_task_pending(self):
-        """Mark selected task as pending."""
+        task = self.edit_task_ref
+        task.name = new_name
+        self.schedule_save()
+        # A load finishing while the dialog was open may have renumbered the
+        # task and started a fresh fill; make sure its row is in the tree
+        self.finish_fill()
+        self.task_tree.set(str(task.id), 'Task', new_name)
+        self.hide_edit_dialog()
+        self.flash_status("Task updated")
+    
+    def hide_edit_dialog(self, event=None):
+        """Hide the edit dialog so it can be reused."""
+        self.edit_window.grab_release()
+        self.edit_window.withdraw()
+        self.edit_task_ref = None
+    
+    def set_status(self, new_status, event=None):
+        """Set the selected task's status to new_status."""
+        label = STATUS_TAG[new_status]
         selection = self.task_tree.selection()
         if not selection:
-            messagebox.showwarning("Warning", "Please select a task to mark as pending!")
+            messagebox.showwarning("Warning", f"Please select a task to mark as {label}!")
             return
         
-        item = self.task_tree.item(selection[0])
-        task_id = int(item['values'][0])
-        
-        for task in self.tasks:
-            if task['id'] == task_id:
-                if task['status'] == 'Not Done':
-                    messagebox.showinfo("Info", "Task is already marked as pending!")
-                else:
-                    task['status'] = 'Not Done'
-                    self.save_tasks()
-                    # Refresh with current filter
-                    self.refresh_task_list(self.current_filter)
-                    self.update_statistics()
-                    messagebox.showinfo("Success", f"Task '{task['name']}' marked as pending!")
-                return
-    
-    def delete_task(self):
+        task = self.tasks_by_id.get(int(selection[0]))
+        if not task:
+            return
+        if task.status == new_status:
+            self.flash_status(f"Task is already marked as {label}")
+            return
+        
+        self.set_task_status(task, new_status)
+        self.schedule_save()
+        self.update_task_row(task)
+        self.update_statistics()
+        self.flash_status(f"Task '{task.name}' marked as {label}")
+    
+    def mark_task_done(self, event=None):
+        """Mark selected task as done."""
+        self.set_status('Done')
+    
+    def mark_task_pending(self, event=None):
+        """Mark selected task as pending."""
+        self.set_status('Not Done')
+    
+    def delete_task(self, event=None):
         """Delete selected task(s)."""
         selection = self.task_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select at least one task to delete!")
             return
         
-        task_ids = []
-        task_names = []
-        for sel in selection:
-            item = self.task_tree.item(sel)
-            task_ids.append(int(item['values'][0]))
-            task_names.append(item['values'][2])
-        
-        count = len(task_ids)
-        names_preview = ", ".join(task_names[:5]) + (", ..." if len(task_names) > 5 else "")
+        tasks = [self.tasks_by_id[int(iid)] for iid in selection]
+        count = len(tasks)
+        names_preview = (", ".join(task.name for task in tasks[:5])
+                         + (", ..." if count > 5 else ""))
         result = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {count} task(s)?\n{names_preview}")
         if result:
-            # Remove tasks by id
-            id_set = set(task_ids)
-            self.tasks = [task for task in self.tasks if task['id'] not in id_set]
-            
-            # Reassign IDs
-            for i, task in enumerate(self.tasks, 1):
-                task['id'] = i
+            # The load can finish while the dialog is open and renumber tasks
+            # added before it, so go by the task objects, not the old ids
+            tasks = [task for task in tasks if self.tasks_by_id.get(task.id) is task]
+            # Later fill chunks go in at fill_head, so finish before removing rows
+            self.finish_fill()
+            self.task_tree.delete(*(str(task.id) for task in tasks))
+            # Pop deleted tasks from the id store; the other tasks are never touched
+            for task in tasks:
+                del self.tasks_by_id[task.id]
+                self.remove_from_bucket(task)
+                if task.status == 'Done':
+                    self.completed_count -= 1
             
-            self.save_tasks()
-            # Refresh with current filter
-            self.refresh_task_list(self.current_filter)
+            self.schedule_save()
             self.update_statistics()
-            messagebox.showinfo("Success", f"Deleted {count} task(s) successfully!")
+            self.flash_status(f"Deleted {len(tasks)} task(s)")
     
-    def filter_done(self):
+    def filter_done(self, event=None):
         """Show only completed tasks."""
         self.current_filter = 'Done'
         self.refresh_task_list('Done')
     
-    def filter_pending(self):
+    def filter_pending(self, event=None):
         """Show only pending tasks."""
         self.current_filter = 'Not Done'
         self.refresh_task_list('Not Done')
     
-    def show_all_tasks(self):
+    def show_all_tasks(self, event=None):
         """Show all tasks."""
         self.current_filter = None
         self.refresh_task_list(None)
     
     def update_statistics(self):
         """Update statistics display."""
-        total_tasks = len(self.tasks)
-        completed_tasks = len([task for task in self.tasks if task['status'] == 'Done'])
+        total_tasks = len(self.tasks_by_id)
+        completed_tasks = self.completed_count
         pending_tasks = total_tasks - completed_tasks
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
-        stats_text = (f"📊 Total Tasks: {total_tasks}  |  "
-                     f"✅ Completed: {completed_tasks}  |  "
-                     f"⏳ Pending: {pending_tasks}  |  "
-                     f"📈 Completion Rate: {completion_rate:.1f}%")
-        self.stats_label.config(text=stats_text)
+        # Skip reconfiguring the label (and the relayout it triggers) if nothing changed
+        stats = (total_tasks, completed_tasks, pending_tasks, completion_rate)
+        if stats == self.last_stats:
+            return
+        self.last_stats = stats
+        self.stats_label.config(text=STATS_TEMPLATE.format(*stats))
     
     def logout(self):
         """Handle user logout."""
         result = messagebox.askyesno("Logout", "Are you sure you want to logout?")
         if result:
-            self.save_tasks()
-            self.root.destroy()
-            # Restart application with login window
-            main()
+            self.flush_save()
+            # Drop cached password hashes for the previous session
+            LoginWindow.hash_password.cache_clear()
+            LoginWindow.derive_key.cache_clear()
+            # Return to the login form in the same root window
+            self.teardown()
+            show_login(self.root)
     
     def on_closing(self):
         """Handle application closing."""
-        self.save_tasks()
+        self.flush_save()
         self.root.destroy()
     
+    def on_task_shortcut(self, event):
+        """Run the task action for a shortcut key unless the user is typing."""
+        if isinstance(event.widget, tk.Entry) or not self.task_tree.focus():
+            return
+        self.task_shortcuts[event.keysym]()
+    
     def on_tree_double_click(self, event):
         """Open edit dialog on double-click (single item required)."""
         # allow the event to set selection; then call edit if single
         sel = self.task_tree.selection()
         if len(sel) == 1:
-            self.edit_task()
+            self.edit_task(selection=sel)
         elif len(sel) > 1:
             messagebox.showwarning("Warning", "Double-clicked multiple items — select only one to edit.")
 
 
+def show_login(root):
+    """Show the login form in root and open the task list once a user signs in."""
+    return LoginWindow(root, on_login=lambda username: TodoGUIApp(root, username))
+
+
 def main():
-    # Create login window
-    login_root = tk.Tk()
-    login_window = LoginWindow(login_root)
-    login_root.mainloop()
-    
-    # Get logged-in user
-    username = login_window.get_current_user()
-    
-    # Launch main application
-    if username:
-        root = tk.Tk()
-        app = TodoGUIApp(root, username)
-        root.mainloop()
+    # One Tk root serves the login form and the task list for the whole session
+    root = tk.Tk()
+    init_fonts(root)
+    init_styles(root)
+    show_login(root)
+    root.mainloop()
 
 
 if __name__ == "__main__":